@@ -0,0 +1,92 @@
+"""Benchmark kopii zapasowych: czas snapshotu i przywracania dla tysięcy kluczy.
+
+Użycie: python bench_backup.py [liczba_kluczy]   (domyślnie 5000)
+Wszystko dzieje się w katalogu tymczasowym (APP_DIR i HOME), prawdziwe ~/.ssh nie jest dotykane.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+
+# --- Katalog tymczasowy jako HOME (musi być ustawiony przed importem main) ---
+TMP_ROOT = tempfile.mkdtemp(prefix="bench_backup_")
+os.environ["HOME"] = os.path.join(TMP_ROOT, "home")
+os.environ["USERPROFILE"] = os.environ["HOME"] # expanduser na Windows
+
+import main
+
+def point_app_at(app_dir):
+    """Przestawia stałe ścieżek modułu main na katalog tymczasowy."""
+    main.APP_DIR = app_dir
+    main.LOCAL_KEYS_STORAGE_DIR = os.path.join(app_dir, main.LOCAL_KEYS_BASE_DIR_NAME)
+    main.LOCAL_CONFIG_FILE_PATH = os.path.join(main.LOCAL_KEYS_STORAGE_DIR, main.LOCAL_CONFIG_FILENAME)
+    main.KEYS_DB = os.path.join(app_dir, "keys_db.json")
+    main.CONFIG_PATH = os.path.expanduser("~/.ssh/config")
+    main.BACKUP_DIR = os.path.join(app_dir, "keys_backup")
+    main.BACKUP_OBJECTS_DIR = os.path.join(main.BACKUP_DIR, "objects")
+    main.BACKUP_SNAPSHOTS_DIR = os.path.join(main.BACKUP_DIR, "snapshots")
+    main.BACKUP_INDEX = os.path.join(main.BACKUP_DIR, "index.json")
+    main.BACKUP_CORRUPT_DIR = os.path.join(main.BACKUP_DIR, "corrupt")
+
+def generate_fake_keys(count):
+    """Tworzy pliki kluczy (bez ssh-keygen) i wpisy w bazie; co drugi klucz 'przeniesiony' do ~/.ssh."""
+    ssh_dir = os.path.expanduser("~/.ssh")
+    main.ensure_dir(main.LOCAL_KEYS_STORAGE_DIR)
+    main.ensure_dir(ssh_dir)
+    keys = {}
+    for i in range(count):
+        alias = f"bench{i}"
+        in_ssh = i % 2 == 1
+        key_paths = [os.path.join(main.LOCAL_KEYS_STORAGE_DIR, alias)]
+        if in_ssh:
+            key_paths.append(os.path.join(ssh_dir, alias)) # Przeniesiony klucz ma też kopię lokalną
+        private_content = os.urandom(200).hex()
+        for key_path in key_paths:
+            with open(key_path, "w", encoding="utf-8") as f:
+                f.write(private_content)
+            with open(key_path + ".pub", "w", encoding="utf-8") as f:
+                f.write(f"# key_name: id_ed25519_github-{alias}\nssh-ed25519 AAAA{i:08d} bench\n")
+        keys[alias] = {
+            "email": f"{alias}@example.com",
+            "host": "github.com",
+            "path": key_paths[-1],
+            "config_host_alias": f"github-{alias}",
+            "in_ssh_dir": in_ssh
+        }
+    with open(main.KEYS_DB, "w", encoding="utf-8") as f:
+        json.dump(keys, f, indent=4, ensure_ascii=False)
+    main.update_config_file()
+    main.update_local_config_file()
+
+def timed(label, func, line_index=1):
+    """Uruchamia funkcję, wypisuje czas i wybraną linię wyniku (dla create_backup: liczniki plików)."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    if result is None:
+        sys.exit(f"BŁĄD: '{label}' nie powiodło się.")
+    details = result.splitlines()[line_index]
+    print(f"{label:<28} {elapsed:8.3f} s   {details}")
+
+if __name__ == '__main__':
+    key_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    try:
+        point_app_at(os.path.join(TMP_ROOT, "app"))
+        generate_fake_keys(key_count)
+        print(f"Kluczy: {key_count}, plików w kopii: {len(main.collect_backup_files())}")
+
+        timed("Pełna kopia", main.create_backup)
+        timed("Kopia bez zmian", main.create_backup)
+
+        # Zmiana ~1% plików kluczy prywatnych
+        for i in range(0, key_count, 100):
+            with open(os.path.join(main.LOCAL_KEYS_STORAGE_DIR, f"bench{i}"), "a", encoding="utf-8") as f:
+                f.write("changed")
+        timed("Kopia po zmianie 1%", main.create_backup)
+
+        timed("Przywrócenie ostatniej kopii", main.restore_backup, line_index=0)
+        timed("Kopia po przywróceniu", main.create_backup)
+    finally:
+        shutil.rmtree(TMP_ROOT, ignore_errors=True)
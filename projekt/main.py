@@ -3,12 +3,14 @@ import json
 import shutil
 import subprocess
 import sys 
+import hashlib
+from datetime import datetime
 
 # --- Importy PyQt6 ---
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
     QLabel, QLineEdit, QComboBox, QPushButton, QGroupBox, QListWidget,
-    QMessageBox, QTextEdit, QDialog, QDialogButtonBox, QSizePolicy
+    QMessageBox, QTextEdit, QDialog, QDialogButtonBox, QSizePolicy, QInputDialog
 )
 from PyQt6.QtGui import QPalette, QColor, QFont # Importy dla palety, kolorów i czcionek
 from PyQt6.QtCore import Qt # Importy dla stałych Qt (np. AlignmentFlag)
@@ -31,6 +33,11 @@ LOCAL_CONFIG_FILENAME = "config" # Zmieniona nazwa lokalnego pliku config
 LOCAL_CONFIG_FILE_PATH = os.path.join(LOCAL_KEYS_STORAGE_DIR, LOCAL_CONFIG_FILENAME) # Pełna ścieżka do lokalnego pliku config
 KEYS_DB = os.path.join(APP_DIR, "keys_db.json") # Ścieżka do bazy metadanych kluczy
 CONFIG_PATH = os.path.expanduser("~/.ssh/config") # Ścieżka do systemowego pliku ~/.ssh/config
+BACKUP_DIR = os.path.join(APP_DIR, "keys_backup") # Katalog magazynu kopii zapasowych
+BACKUP_OBJECTS_DIR = os.path.join(BACKUP_DIR, "objects") # Zawartość plików adresowana hashem SHA-256
+BACKUP_SNAPSHOTS_DIR = os.path.join(BACKUP_DIR, "snapshots") # Manifesty poszczególnych kopii
+BACKUP_INDEX = os.path.join(BACKUP_DIR, "index.json") # Pamięć podręczna (inode, mtime, size) -> hash
+BACKUP_CORRUPT_DIR = os.path.join(BACKUP_DIR, "corrupt") # Obiekty z niezgodnym hashem (kwarantanna)
 
 # --- Kolory dla Ciemnego Motywu (używane w QPalette) ---
 DARK_COLOR = QColor(45, 45, 45)             # Ciemnoszary dla tła okna
@@ -395,6 +402,336 @@ def show_local_config_file():
         # Zwraca informację, jeśli plik jeszcze nie istnieje
         return f"Lokalny plik konfiguracyjny '{LOCAL_CONFIG_FILENAME}' nie istnieje (folder: '{LOCAL_KEYS_BASE_DIR_NAME}').\nZostanie utworzony po wygenerowaniu pierwszego klucza."
 
+# --- Kopie Zapasowe (magazyn adresowany zawartością) ---
+def _hash_file(file_path):
+    """Zwraca skrót SHA-256 zawartości pliku (czytanego blokami)."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _write_json_atomic(file_path, data):
+    """Zapisuje JSON do pliku tymczasowego i podmienia go atomowo."""
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, file_path)
+
+def _backup_object_path(file_hash):
+    """Ścieżka obiektu w magazynie (dwuznakowy podkatalog jak w git)."""
+    return os.path.join(BACKUP_OBJECTS_DIR, file_hash[:2], file_hash)
+
+def _report_backup_error(parent_widget, title, message, warning=False):
+    """Pokazuje błąd kopii zapasowej w oknie GUI lub (w trybie wiersza poleceń) na stderr."""
+    if parent_widget:
+        if warning: QMessageBox.warning(parent_widget, title, message)
+        else: QMessageBox.critical(parent_widget, title, message)
+    else:
+        print(f"BŁĄD: {message}", file=sys.stderr)
+
+def _load_keys_for_backup():
+    """Odczytuje bazę kluczy; zwraca pusty słownik, jeśli jej brak lub jest uszkodzona."""
+    try:
+        with open(KEYS_DB, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def collect_backup_files():
+    """Zwraca słownik {nazwa w kopii: ścieżka} plików objętych kopią zapasową.
+
+    Kopia obejmuje tylko pliki, o których wie baza: keys_db.json, pliki kluczy
+    z bazy w generated_keys_storage (i w ~/.ssh, jeśli klucz jest przeniesiony)
+    oraz oba pliki config. Inne pliki w tych katalogach są pomijane, więc
+    klucze-sieroty (bez wpisu w bazie) nie trafiają do kolejnych kopii.
+    """
+    files = {}
+    if os.path.isfile(KEYS_DB):
+        files["keys_db.json"] = KEYS_DB
+    ssh_dir = os.path.expanduser("~/.ssh")
+    for alias, data in _load_keys_for_backup().items():
+        for name in (alias, alias + ".pub"):
+            local_path = os.path.join(LOCAL_KEYS_STORAGE_DIR, name) # Kopia lokalna zostaje także po przeniesieniu
+            if os.path.isfile(local_path):
+                files[f"{LOCAL_KEYS_BASE_DIR_NAME}/{name}"] = local_path
+            ssh_path = os.path.join(ssh_dir, name)
+            if data.get("in_ssh_dir") and os.path.isfile(ssh_path):
+                files[f"ssh/{name}"] = ssh_path
+    if os.path.isfile(LOCAL_CONFIG_FILE_PATH):
+        files[f"{LOCAL_KEYS_BASE_DIR_NAME}/{LOCAL_CONFIG_FILENAME}"] = LOCAL_CONFIG_FILE_PATH
+    if os.path.isfile(CONFIG_PATH):
+        files["ssh/config"] = CONFIG_PATH
+    return files
+
+def _restore_target_path(name):
+    """Zamienia nazwę z manifestu na ścieżkę docelową (w bieżącym APP_DIR / ~/.ssh)."""
+    if name == "keys_db.json":
+        return KEYS_DB
+    prefix, _, file_name = name.partition("/")
+    file_name = os.path.basename(file_name) # Nie pozwól manifestowi wyjść poza katalog docelowy
+    if prefix == LOCAL_KEYS_BASE_DIR_NAME and file_name:
+        return os.path.join(LOCAL_KEYS_STORAGE_DIR, file_name)
+    if prefix == "ssh" and file_name:
+        return os.path.join(os.path.expanduser("~/.ssh"), file_name)
+    return None
+
+def list_backup_snapshots():
+    """Zwraca identyfikatory zapisanych kopii (od najstarszej)."""
+    if not os.path.isdir(BACKUP_SNAPSHOTS_DIR):
+        return []
+    return sorted(name[:-len(".json")] for name in os.listdir(BACKUP_SNAPSHOTS_DIR) if name.endswith(".json"))
+
+def _store_backup_object(file_path):
+    """Kopiuje plik do magazynu i zwraca (hash, rozmiar, czy_nowy, czy_naprawiony).
+
+    Hash jest liczony z już skopiowanego pliku .tmp, więc obiekt zawsze
+    zgadza się ze swoją nazwą, nawet gdy źródło zmieni się w trakcie kopiowania.
+    Istniejący obiekt o innym rozmiarze jest uznawany za uszkodzony i nadpisywany.
+    """
+    tmp_path = os.path.join(BACKUP_OBJECTS_DIR, "incoming.tmp")
+    shutil.copyfile(file_path, tmp_path)
+    if os.name != 'nt':
+        os.chmod(tmp_path, 0o600)
+    file_hash = _hash_file(tmp_path)
+    size = os.path.getsize(tmp_path)
+    object_path = _backup_object_path(file_hash)
+    if os.path.exists(object_path) and os.path.getsize(object_path) == size: # Deduplikacja: ta sama treść zapisana tylko raz
+        os.remove(tmp_path)
+        return file_hash, size, False, False
+    repaired = os.path.exists(object_path)
+    ensure_dir(os.path.dirname(object_path))
+    os.replace(tmp_path, object_path)
+    return file_hash, size, not repaired, repaired
+
+def _quarantine_backup_object(file_hash):
+    """Przenosi uszkodzony obiekt do keys_backup/corrupt, aby następna kopia zapisała go od nowa."""
+    try:
+        ensure_dir(BACKUP_CORRUPT_DIR)
+        os.replace(_backup_object_path(file_hash), os.path.join(BACKUP_CORRUPT_DIR, file_hash))
+    except OSError as e:
+        print(f"Ostrzeżenie: Nie udało się przenieść uszkodzonego obiektu {file_hash}: {e}")
+
+def _write_backup_snapshot():
+    """Zapisuje nową kopię i zwraca (id_kopii, liczba_plików, przeliczonych, nowych, naprawionych).
+
+    Błędy wejścia/wyjścia są zgłaszane jako OSError (obsługują je wywołujący).
+    """
+    for dir_path in (BACKUP_DIR, BACKUP_OBJECTS_DIR, BACKUP_SNAPSHOTS_DIR):
+        ensure_dir(dir_path)
+    if os.name != 'nt': # Magazyn zawiera klucze prywatne
+        os.chmod(BACKUP_DIR, 0o700)
+
+    try:
+        with open(BACKUP_INDEX, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        index = {} # Brak indeksu oznacza pełne hashowanie
+
+    new_index = {}
+    manifest_files = {}
+    hashed_count = 0
+    copied_count = 0
+    repaired_count = 0
+    for name, file_path in collect_backup_files().items():
+        st = os.stat(file_path) # Sygnatura sprzed kopiowania: zmiana w trakcie wymusi ponowne hashowanie następnym razem
+        signature = [st.st_ino, st.st_mtime_ns, st.st_size]
+        cached = index.get(file_path)
+        cached_object = _backup_object_path(cached["hash"]) if cached else None
+        if cached and cached.get("signature") == signature and os.path.exists(cached_object) \
+                and os.path.getsize(cached_object) == st.st_size:
+            file_hash, size = cached["hash"], st.st_size # Plik niezmieniony od poprzedniej kopii
+        else:
+            file_hash, size, is_new, is_repaired = _store_backup_object(file_path)
+            hashed_count += 1
+            copied_count += is_new
+            repaired_count += is_repaired
+        new_index[file_path] = {"signature": signature, "hash": file_hash}
+        manifest_files[name] = {"hash": file_hash, "size": size, "mode": st.st_mode & 0o777}
+
+    snapshot_id = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    manifest = {"created": datetime.now().isoformat(timespec="seconds"), "files": manifest_files}
+    _write_json_atomic(os.path.join(BACKUP_SNAPSHOTS_DIR, snapshot_id + ".json"), manifest)
+    _write_json_atomic(BACKUP_INDEX, new_index)
+    return snapshot_id, len(manifest_files), hashed_count, copied_count, repaired_count
+
+def create_backup(parent_widget=None):
+    """Tworzy przyrostową kopię: hashuje tylko pliki o zmienionym (inode, mtime, size), kopiuje tylko nowe treści."""
+    try:
+        snapshot_id, file_count, hashed_count, copied_count, repaired_count = _write_backup_snapshot()
+    except OSError as e:
+        _report_backup_error(parent_widget, "Błąd kopii zapasowej", f"Nie można utworzyć kopii zapasowej w {BACKUP_DIR}:\n{e}")
+        return None
+
+    if repaired_count:
+        header = (f"UWAGA: Kopia zapasowa '{snapshot_id}' utworzona, ale w magazynie wykryto uszkodzone obiekty "
+                  f"({repaired_count}) - zastąpiono je świeżą kopią plików.")
+    else:
+        header = f"Kopia zapasowa '{snapshot_id}' utworzona."
+    return (f"{header}\n"
+            f"Plików w kopii: {file_count}, przeliczonych: {hashed_count}, nowych obiektów: {copied_count}.")
+
+def _relocate_restored_keys(parent_widget=None):
+    """Ustawia ścieżki kluczy w przywróconej bazie na bieżące katalogi i odbudowuje oba pliki config.
+
+    Kopia mogła powstać, gdy aplikacja leżała w innym katalogu - stare absolutne
+    ścieżki w bazie i w lokalnym configu wskazywałyby wtedy na nieistniejące pliki.
+    """
+    try:
+        with open(KEYS_DB, "r", encoding="utf-8") as f:
+            keys = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        _report_backup_error(parent_widget, "Błąd Bazy Danych", f"Nie można odczytać przywróconej bazy {KEYS_DB}:\n{e}")
+        return False
+    ssh_dir = os.path.expanduser("~/.ssh")
+    for alias, data in keys.items():
+        data["path"] = os.path.join(ssh_dir if data.get("in_ssh_dir") else LOCAL_KEYS_STORAGE_DIR, alias)
+    try:
+        with open(KEYS_DB, "w", encoding="utf-8") as f:
+            json.dump(keys, f, indent=4, ensure_ascii=False)
+    except IOError as e:
+        _report_backup_error(parent_widget, "Błąd zapisu DB", f"Nie można zapisać przywróconej bazy {KEYS_DB}:\n{e}")
+        return False
+    config_ok = update_config_file(parent_widget)
+    local_config_ok = update_local_config_file()
+    return config_ok and local_config_ok
+
+def _remove_staged(staged):
+    """Usuwa pozostałe pliki '<cel>.tmp' z etapu przygotowania."""
+    for target_path, _ in staged:
+        try:
+            if os.path.exists(target_path + ".tmp"): os.remove(target_path + ".tmp")
+        except OSError as e:
+            print(f"Ostrzeżenie: Nie udało się usunąć pliku tymczasowego {target_path}.tmp: {e}")
+
+def restore_backup(snapshot_id=None, parent_widget=None):
+    """Przywraca bazę, pliki kluczy i oba pliki config z wybranej (domyślnie ostatniej) kopii.
+
+    Wszystkie obiekty są najpierw kopiowane do plików '<cel>.tmp' i weryfikowane
+    hashem. Brakujący lub uszkodzony obiekt (ten drugi trafia do keys_backup/corrupt)
+    jest pomijany i zgłaszany w wyniku; przywracanie jest przerywane tylko wtedy,
+    gdy nie da się przygotować samej bazy keys_db.json. Przed podmianą plików
+    bieżący stan jest zapisywany jako nowa kopia, więc przywrócenie można cofnąć.
+    Po podmianie ścieżki w bazie są przepisywane na bieżące generated_keys_storage
+    i ~/.ssh, a oba pliki config są generowane od nowa (aplikacja mogła zostać przeniesiona).
+    Pliki kluczy spoza kopii nie są usuwane, tylko zgłaszane w wyniku (klucze z
+    generated_keys_storage i klucze z ~/.ssh, które bieżąca baza oznacza jako przeniesione).
+    """
+    snapshots = list_backup_snapshots()
+    if not snapshots:
+        _report_backup_error(parent_widget, "Brak kopii", f"Brak kopii zapasowych w {BACKUP_DIR}.", warning=True)
+        return None
+    if snapshot_id is None:
+        snapshot_id = snapshots[-1]
+    if snapshot_id not in snapshots:
+        _report_backup_error(parent_widget, "Nie znaleziono kopii", f"Kopia '{snapshot_id}' nie istnieje.", warning=True)
+        return None
+
+    try:
+        with open(os.path.join(BACKUP_SNAPSHOTS_DIR, snapshot_id + ".json"), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        _report_backup_error(parent_widget, "Błąd kopii zapasowej", f"Nie można odczytać manifestu kopii '{snapshot_id}':\n{e}")
+        return None
+
+    ssh_dir = os.path.expanduser("~/.ssh")
+    previously_in_ssh = [alias for alias, data in _load_keys_for_backup().items() if data.get("in_ssh_dir")]
+
+    # Etap 1: przygotowanie wszystkich plików .tmp (bieżące pliki pozostają nietknięte)
+    staged = [] # Lista (ścieżka docelowa, hash)
+    skipped = [] # Wpisy z nieznanym prefiksem lub brakującym obiektem
+    corrupted = [] # Wpisy, których obiekt nie zgadza się z hashem
+    corrupted_hashes = set() # Obiekty już przeniesione do kwarantanny (ta sama treść może wystąpić w kilku wpisach)
+    try:
+        for name, info in manifest.get("files", {}).items():
+            target_path = _restore_target_path(name)
+            object_path = _backup_object_path(info["hash"])
+            if info["hash"] in corrupted_hashes:
+                corrupted.append(name)
+                continue
+            if target_path is None or not os.path.exists(object_path):
+                skipped.append(name)
+                continue
+            ensure_dir(os.path.dirname(target_path))
+            shutil.copyfile(object_path, target_path + ".tmp")
+            if _hash_file(target_path + ".tmp") != info["hash"]:
+                os.remove(target_path + ".tmp")
+                _quarantine_backup_object(info["hash"])
+                corrupted_hashes.add(info["hash"])
+                corrupted.append(name)
+                continue
+            if os.name != 'nt':
+                os.chmod(target_path + ".tmp", info.get("mode", 0o600))
+            staged.append((target_path, info["hash"]))
+        if KEYS_DB not in {target_path for target_path, _ in staged}:
+            raise OSError("Nie można przygotować bazy keys_db.json z tej kopii (brak w kopii, brak obiektu lub obiekt uszkodzony).")
+    except OSError as e:
+        _remove_staged(staged)
+        _report_backup_error(parent_widget, "Błąd przywracania", f"Błąd podczas przygotowania kopii '{snapshot_id}' (bieżące pliki nie zostały zmienione):\n{e}")
+        return None
+
+    # Zabezpieczenie: zapis bieżącego stanu jako kopii, aby przywrócenie dało się cofnąć
+    try:
+        undo_snapshot_id = _write_backup_snapshot()[0]
+    except OSError as e:
+        _remove_staged(staged)
+        _report_backup_error(parent_widget, "Błąd przywracania", f"Nie można zapisać bieżącego stanu przed przywróceniem (bieżące pliki nie zostały zmienione):\n{e}")
+        return None
+
+    try:
+        with open(BACKUP_INDEX, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        index = {}
+
+    # Etap 2: podmiana plików docelowych
+    replaced = [] # Pliki już podmienione (do raportu przy błędzie)
+    try:
+        for target_path, file_hash in staged:
+            os.replace(target_path + ".tmp", target_path)
+            replaced.append(target_path)
+            st = os.stat(target_path)
+            # Przywrócony plik ma znany hash - następna kopia nie musi go przeliczać
+            index[target_path] = {"signature": [st.st_ino, st.st_mtime_ns, st.st_size], "hash": file_hash}
+    except OSError as e:
+        _remove_staged(staged)
+        replaced_text = "\n".join(replaced) if replaced else "(żaden)"
+        _report_backup_error(parent_widget, "Błąd przywracania",
+                             f"Błąd podczas podmiany plików z kopii '{snapshot_id}':\n{e}\n"
+                             f"Już podmienione pliki:\n{replaced_text}\n"
+                             f"Poprzedni stan można przywrócić z kopii '{undo_snapshot_id}'.")
+        return None
+    finally:
+        try: # Indeks zawsze odpowiada faktycznie podmienionym plikom
+            _write_json_atomic(BACKUP_INDEX, index)
+        except OSError as e:
+            print(f"Ostrzeżenie: Nie udało się zapisać indeksu kopii {BACKUP_INDEX}: {e}")
+
+    relocated = _relocate_restored_keys(parent_widget)
+
+    # Klucze spoza kopii: nie są usuwane (to mogą być jedyne kopie kluczy prywatnych), tylko zgłaszane
+    snapshot_paths = {_restore_target_path(name) for name in manifest.get("files", {})} | {LOCAL_CONFIG_FILE_PATH}
+    orphans = []
+    if os.path.isdir(LOCAL_KEYS_STORAGE_DIR):
+        with os.scandir(LOCAL_KEYS_STORAGE_DIR) as entries:
+            orphans += [entry.path for entry in entries if entry.is_file() and entry.path not in snapshot_paths]
+    for alias in previously_in_ssh:
+        for name in (alias, alias + ".pub"):
+            ssh_path = os.path.join(ssh_dir, name)
+            if os.path.isfile(ssh_path) and ssh_path not in snapshot_paths:
+                orphans.append(ssh_path)
+
+    result = f"Przywrócono kopię '{snapshot_id}'. Plików: {len(replaced)}."
+    result += f"\nStan sprzed przywrócenia zapisano jako kopię '{undo_snapshot_id}'."
+    if not relocated:
+        result += "\nUWAGA: Nie udało się zaktualizować ścieżek w bazie lub plików config."
+    if corrupted:
+        result += f"\nUszkodzone (niezgodny hash, nie przywrócono): {', '.join(corrupted)}"
+    if skipped:
+        result += f"\nPominięto (brak obiektu lub nieznana ścieżka): {', '.join(skipped)}"
+    if orphans:
+        result += f"\nPliki spoza kopii (nieobecne w przywróconej bazie, nie usunięto): {', '.join(sorted(orphans))}"
+    return result
 
 # --- Klasa Okna Dialogowego do Wyświetlania Tekstu ---
 class TextViewerDialog(QDialog): # Dziedziczy po QDialog (standardowe okno dialogowe)
@@ -484,6 +821,14 @@ class SSHKeyManagerApp(QWidget): # Główny widget aplikacji
         self.show_local_config_btn.clicked.connect(self.on_show_local_config)
         actions_layout.addWidget(self.show_local_config_btn, 1, 2) # Wiersz 1, Kolumna 2
 
+        self.backup_btn = QPushButton("Utwórz kopię zapasową")
+        self.backup_btn.clicked.connect(self.on_backup)
+        actions_layout.addWidget(self.backup_btn, 2, 0) # Wiersz 2, Kolumna 0
+
+        self.restore_btn = QPushButton("Przywróć kopię zapasową")
+        self.restore_btn.clicked.connect(self.on_restore)
+        actions_layout.addWidget(self.restore_btn, 2, 1) # Wiersz 2, Kolumna 1
+
         main_layout.addWidget(actions_groupbox) # Dodaj ramkę akcji do głównego layoutu
 
         # --- Ramka Listy Kluczy ---
@@ -551,6 +896,31 @@ class SSHKeyManagerApp(QWidget): # Główny widget aplikacji
                 self.show_message("Usuwanie Klucza", result)
                 self.load_and_display_keys() # Odśwież listę
 
+    def on_backup(self):
+        result = create_backup(parent_widget=self) # Wywołaj funkcję tworzącą kopię
+        if result:
+            self.show_message("Kopia Zapasowa", result)
+
+    def on_restore(self):
+        snapshots = list_backup_snapshots()
+        if not snapshots:
+            self.show_message("Brak kopii", f"Brak kopii zapasowych w {BACKUP_DIR}.", QMessageBox.Icon.Warning)
+            return
+        # Wybór kopii (domyślnie najnowsza)
+        snapshot_id, ok = QInputDialog.getItem(self, "Przywracanie kopii", "Wybierz kopię do przywrócenia:",
+                                               list(reversed(snapshots)), 0, False)
+        if not ok:
+            return
+        reply = QMessageBox.question(self, "Potwierdzenie przywrócenia",
+                                     f"Przywrócenie kopii '{snapshot_id}' nadpisze bazę, pliki kluczy i pliki config. Kontynuować?",
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                     QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
+            result = restore_backup(snapshot_id, parent_widget=self) # Wywołaj funkcję przywracającą
+            if result:
+                self.show_message("Przywracanie Kopii", result)
+                self.load_and_display_keys() # Odśwież listę
+
     def on_show_config(self):
         """Wyświetla zawartość systemowego pliku config."""
         content = show_config()
@@ -628,6 +998,18 @@ class SSHKeyManagerApp(QWidget): # Główny widget aplikacji
 
 # --- Główna część aplikacji (uruchomienie) ---
 if __name__ == '__main__':
+    # Tryb wiersza poleceń: "main.py backup" lub "main.py restore [id_kopii]" (bez uruchamiania GUI)
+    if len(sys.argv) > 1 and sys.argv[1] in ("backup", "restore"):
+        if sys.argv[1] == "backup":
+            result = create_backup()
+        else:
+            result = restore_backup(sys.argv[2] if len(sys.argv) > 2 else None)
+        if result:
+            print(result)
+        else: # Przyczyna została już wypisana na stderr
+            print(f"BŁĄD: Operacja '{sys.argv[1]}' nie powiodła się.", file=sys.stderr)
+        sys.exit(0 if result else 1)
+
     app = QApplication(sys.argv) # Inicjalizacja aplikacji PyQt
 
     # --- Ustawienie Prostej Ciemnej Palety Kolorów ---